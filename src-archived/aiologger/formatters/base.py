@@ -236,3 +236,13 @@ class Formatter:
                 s = s + self.terminator
             s = s + self.format_stack(record.stack_info)
         return s
+
+    def format_bytes(self, record: LogRecord) -> bytes:
+        """
+        Format the specified record as UTF-8 encoded bytes.
+
+        Handlers writing to byte streams call this instead of format(), so
+        formatters able to produce bytes directly can skip the intermediate
+        str. The base implementation encodes the result of format().
+        """
+        return self.format(record).encode()
@@ -43,13 +43,7 @@ class JsonFormatter(Formatter):
             return obj()
         return str(obj)
 
-    def format(self, record: LogRecord) -> str:
-        """
-        Formats a record and serializes it as a JSON str. If record message isnt
-        already a dict, initializes a new dict and uses `default_msg_fieldname`
-        as a key as the record msg as the value.
-        If the serialized result is of type bytes (if orjson is used), then it is converted to utf-8.
-        """
+    def _format_msg(self, record: LogRecord) -> dict:
         msg: Union[str, dict] = record.msg
         if not isinstance(msg, dict):
             msg = {self.default_msg_fieldname: msg}
@@ -59,7 +53,28 @@ class JsonFormatter(Formatter):
         if record.exc_text:
             msg["exc_text"] = record.exc_text
 
-        return self._serializer_ensure_str(msg=msg)
+        return msg
+
+    def format(self, record: LogRecord) -> str:
+        """
+        Formats a record and serializes it as a JSON str. If record message isnt
+        already a dict, initializes a new dict and uses `default_msg_fieldname`
+        as a key as the record msg as the value.
+        If the serialized result is of type bytes (if orjson is used), then it is converted to utf-8.
+        """
+        return self._serializer_ensure_str(msg=self._format_msg(record))
+
+    def format_bytes(self, record: LogRecord) -> bytes:
+        """
+        Formats a record the same way as `format`, but returns the serialized
+        JSON as bytes. If the serializer already returns bytes (if orjson is
+        used), they are returned unchanged instead of being decoded and
+        encoded again.
+        """
+        if type(self).format is not JsonFormatter.format:
+            # Subclasses overriding format() must still go through it
+            return super().format_bytes(record)
+        return self._serializer_ensure_bytes(msg=self._format_msg(record))
 
     @classmethod
     def format_error_msg(cls, record: LogRecord, exception: Exception) -> Dict:
@@ -84,15 +99,11 @@ class JsonFormatter(Formatter):
             },
         }
 
-    def _serializer_ensure_str(
+    def _serialize(
         self,
         msg: dict,
         record: Optional[Union[LogRecord, ExtendedLogRecord]] = None,
-    ) -> str:
-        """
-        This ensures that the formatter will return a str object when the serializer
-        may return a bytes object.
-        """
+    ) -> Union[str, bytes]:
         if hasattr(record, "serializer_kwargs"):
             result: Union[str, bytes] = self.serializer(
                 msg,
@@ -104,15 +115,40 @@ class JsonFormatter(Formatter):
                 msg, default=self._default_handler
             )
 
-        if isinstance(result, str):
-            return result
-        elif isinstance(result, bytes):
-            return result.decode()
-        else:
+        if not isinstance(result, (str, bytes)):
             resType = type(result)
             raise TypeError(
                 f"ERROR: serialized object must be of str or bytes type, given {result} with type {resType}"
             )
+        return result
+
+    def _serializer_ensure_str(
+        self,
+        msg: dict,
+        record: Optional[Union[LogRecord, ExtendedLogRecord]] = None,
+    ) -> str:
+        """
+        This ensures that the formatter will return a str object when the serializer
+        may return a bytes object.
+        """
+        result = self._serialize(msg, record)
+        if isinstance(result, bytes):
+            return result.decode()
+        return result
+
+    def _serializer_ensure_bytes(
+        self,
+        msg: dict,
+        record: Optional[Union[LogRecord, ExtendedLogRecord]] = None,
+    ) -> bytes:
+        """
+        This ensures that the formatter will return a bytes object when the
+        serializer may return a str object.
+        """
+        result = self._serialize(msg, record)
+        if isinstance(result, str):
+            return result.encode()
+        return result
 
 
 class ExtendedJsonFormatter(JsonFormatter):
@@ -164,10 +200,7 @@ class ExtendedJsonFormatter(JsonFormatter):
             if field in self.log_fields:
                 yield field, value
 
-    def format(self, record: ExtendedLogRecord) -> str:  # type: ignore
-        """
-        :type record: aiologger.records.ExtendedLogRecord
-        """
+    def _format_msg(self, record: ExtendedLogRecord) -> dict:  # type: ignore
         msg = dict(self.formatter_fields_for_record(record))
         if record.flatten and isinstance(record.msg, dict):
             msg.update(record.msg)
@@ -181,4 +214,23 @@ class ExtendedJsonFormatter(JsonFormatter):
         if record.exc_text:
             msg["exc_text"] = record.exc_text
 
-        return self._serializer_ensure_str(msg=msg, record=record)
+        return msg
+
+    def format(self, record: ExtendedLogRecord) -> str:  # type: ignore
+        """
+        :type record: aiologger.records.ExtendedLogRecord
+        """
+        return self._serializer_ensure_str(
+            msg=self._format_msg(record), record=record
+        )
+
+    def format_bytes(self, record: ExtendedLogRecord) -> bytes:  # type: ignore
+        """
+        :type record: aiologger.records.ExtendedLogRecord
+        """
+        if type(self).format is not ExtendedJsonFormatter.format:
+            # Subclasses overriding format() must still go through it
+            return super().format_bytes(record)
+        return self._serializer_ensure_bytes(
+            msg=self._format_msg(record), record=record
+        )
@@ -15,6 +15,7 @@ from aiologger.records import LogRecord
 @loop_compat
 class AsyncStreamHandler(Handler):
     terminator = "\n"
+    initialized = False
 
     def __init__(
         self,
@@ -34,27 +35,46 @@ class AsyncStreamHandler(Handler):
         if filter:
             self.add_filter(filter)
         self.protocol_class = AiologgerProtocol
-        self._initialization_lock = asyncio.Lock()
+        self._init_future: Optional[asyncio.Future] = None
         self.writer: Optional[StreamWriter] = None
-
-    @property
-    def initialized(self):
-        return self.writer is not None
+        # The encoded terminator, cached for the str it was encoded from
+        self._terminator: Optional[str] = None
+        self._terminator_bytes = b""
+        self._closed = False
 
     async def _init_writer(self) -> StreamWriter:
-        async with self._initialization_lock:
-            if self.writer is not None:
-                return self.writer
+        while self._init_future is not None:
+            writer = await asyncio.shield(self._init_future)
+            if writer is not None:
+                return writer
 
-            loop = get_running_loop()
+        loop = get_running_loop()
+        init_future = self._init_future = loop.create_future()
+        try:
             transport, protocol = await loop.connect_write_pipe(
                 self.protocol_class, self.stream
             )
+        except BaseException as exc:
+            # Allows the next emit to retry the initialization
+            self._init_future = None
+            # CancelledError only subclasses BaseException since Python 3.8
+            if isinstance(exc, Exception) and not isinstance(
+                exc, asyncio.CancelledError
+            ):
+                init_future.set_exception(exc)
+                init_future.exception()
+            else:
+                # Only the initializing task was cancelled, the ones waiting
+                # for it wake up without a writer and retry on their own
+                init_future.set_result(None)
+            raise
 
-            self.writer = StreamWriter(  # type: ignore # https://github.com/python/typeshed/pull/2719
-                transport=transport, protocol=protocol, reader=None, loop=loop
-            )
-            return self.writer
+        self.writer = StreamWriter(  # type: ignore # https://github.com/python/typeshed/pull/2719
+            transport=transport, protocol=protocol, reader=None, loop=loop
+        )
+        self.initialized = True
+        init_future.set_result(self.writer)
+        return self.writer
 
     async def handle(self, record: LogRecord) -> bool:
         """
@@ -67,20 +87,36 @@ class AsyncStreamHandler(Handler):
         return rv
 
     async def flush(self):
+        if self.writer.transport.get_write_buffer_size() == 0:
+            return
         await self.writer.drain()
 
     async def emit(self, record: LogRecord):
         """
         Actually log the specified logging record to the stream.
         """
-        if self.writer is None:
-            self.writer = await self._init_writer()
+        if record.levelno < self._level:
+            return
+
+        writer = self.writer or await self._init_writer()
 
         try:
-            msg = self.formatter.format(record) + self.terminator
+            formatter = self.formatter
+            if hasattr(formatter, "format_bytes"):
+                msg = formatter.format_bytes(record)
+            else:
+                msg = formatter.format(record).encode()
+
+            terminator = self.terminator
+            if terminator is not self._terminator:
+                self._terminator = terminator
+                self._terminator_bytes = terminator.encode()
 
-            self.writer.write(msg.encode())
-            await self.writer.drain()
+            # A single write() per record: the stdlib writelines() only joins
+            # its arguments before writing them, so joining them here saves
+            # the extra call and keeps record and terminator together
+            writer.write(msg + self._terminator_bytes)
+            await writer.drain()
         except Exception as exc:
             await self.handle_error(record, exc)
 
@@ -92,7 +128,9 @@ class AsyncStreamHandler(Handler):
         should ensure that this gets called from overridden close()
         methods.
         """
-        if self.writer is None:
+        if self.writer is None or self._closed:
             return
+        # Set before flushing, so concurrent closes return right away
+        self._closed = True
         await self.flush()
         self.writer.close()
@@ -5,6 +5,7 @@ import os
 import time
 import types
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Optional, Tuple, Type
 
 from aiologger.levels import LogLevel, get_level_name
@@ -12,6 +13,16 @@ from aiologger.levels import LogLevel, get_level_name
 ExceptionInfo = Tuple[Type[BaseException], BaseException, types.TracebackType]
 
 
+@lru_cache(maxsize=1024)
+def _split_pathname(pathname: str) -> Tuple[str, str]:
+    """
+    Returns the filename and module name of pathname. Records are created
+    over and over for the same few call sites, so results are cached.
+    """
+    filename = os.path.basename(pathname)
+    return filename, os.path.splitext(filename)[0]
+
+
 class LogRecord:
     """
     A LogRecord instance represents an event being logged.
@@ -79,8 +90,7 @@ class LogRecord:
         self.levelno = level
         self.pathname = pathname
         try:
-            self.filename = os.path.basename(pathname)
-            self.module = os.path.splitext(self.filename)[0]
+            self.filename, self.module = _split_pathname(pathname)
         except (TypeError, ValueError, AttributeError):
             self.filename = pathname
             self.module = "Unknown module"
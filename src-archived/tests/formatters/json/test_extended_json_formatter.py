@@ -235,3 +235,28 @@ class ExtendedJsonFormatterTests(unittest.TestCase):
         self.assertEqual(
             custom_orjson_serializer_msg, default_json_serializer_msg
         )
+
+    @freeze_time("2018-06-16T10:16:00-03:00")
+    def test_format_bytes_returns_bytes_from_the_serializer_unchanged(self):
+        custom_formatter = ExtendedJsonFormatter(serializer=orjson.dumps)
+
+        self.assertEqual(
+            custom_formatter.format_bytes(self.record),
+            orjson.dumps(
+                custom_formatter._format_msg(self.record),
+                default=custom_formatter._default_handler,
+            ),
+        )
+        self.assertEqual(
+            self.formatter.format_bytes(self.record),
+            self.formatter.format(self.record).encode(),
+        )
+
+    def test_format_bytes_uses_format_overridden_by_subclasses(self):
+        class CustomJsonFormatter(ExtendedJsonFormatter):
+            def format(self, record):
+                return "Xena"
+
+        self.assertEqual(
+            CustomJsonFormatter().format_bytes(self.record), b"Xena"
+        )
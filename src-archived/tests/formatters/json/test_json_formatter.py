@@ -113,6 +113,32 @@ class JsonFormatterTests(unittest.TestCase):
             custom_orjson_serializer_msg, default_json_serializer_msg
         )
 
+    def test_format_bytes_returns_the_encoded_formatted_record(self):
+        self.record.msg = {"dog": "Xablaú"}
+
+        self.assertEqual(
+            self.formatter.format_bytes(self.record),
+            self.formatter.format(self.record).encode(),
+        )
+
+    def test_format_bytes_returns_bytes_from_the_serializer_unchanged(self):
+        formatter = JsonFormatter(serializer=orjson.dumps)
+        self.record.msg = {"dog": "Xablaú"}
+
+        self.assertEqual(
+            formatter.format_bytes(self.record),
+            orjson.dumps(self.record.msg, default=formatter._default_handler),
+        )
+
+    def test_format_bytes_uses_format_overridden_by_subclasses(self):
+        class CustomJsonFormatter(JsonFormatter):
+            def format(self, record):
+                return "Xena"
+
+        self.assertEqual(
+            CustomJsonFormatter().format_bytes(self.record), b"Xena"
+        )
+
     def test_raise_exception_when_serialiazed_result_type_not_valid(self):
         with self.assertRaises(TypeError):
 
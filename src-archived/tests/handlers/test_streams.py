@@ -1,7 +1,7 @@
 import asyncio
 import fcntl
 import os
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, call
 
 import asynctest
 from asynctest import CoroutineMock
@@ -11,6 +11,12 @@ from aiologger.protocols import AiologgerProtocol
 from aiologger.records import LogRecord
 
 
+def make_writer(buffer_size=0, **kwargs) -> Mock:
+    transport = Mock(get_write_buffer_size=Mock(return_value=buffer_size))
+    kwargs.setdefault("drain", CoroutineMock())
+    return Mock(write=Mock(), transport=transport, **kwargs)
+
+
 class AsyncStreamHandlerTests(asynctest.TestCase):
     async def setUp(self):
         self.record = LogRecord(
@@ -89,10 +95,75 @@ class AsyncStreamHandlerTests(asynctest.TestCase):
 
         await handler.close()
 
+    async def test_concurrent_init_writer_calls_connect_the_pipe_once(self):
+        handler = AsyncStreamHandler(
+            stream=self.write_pipe, level=10, formatter=Mock()
+        )
+        with asynctest.patch.object(
+            self.loop, "connect_write_pipe", wraps=self.loop.connect_write_pipe
+        ) as connect_write_pipe:
+            writers = await asyncio.gather(
+                handler._init_writer(),
+                handler._init_writer(),
+                handler._init_writer(),
+            )
+
+            connect_write_pipe.assert_awaited_once()
+            self.assertEqual(writers, [handler.writer] * 3)
+
+        await handler.close()
+
+    async def test_init_writer_can_be_retried_after_a_failure(self):
+        handler = AsyncStreamHandler(
+            stream=self.write_pipe, level=10, formatter=Mock()
+        )
+        with asynctest.patch.object(
+            self.loop, "connect_write_pipe", side_effect=OSError
+        ):
+            with self.assertRaises(OSError):
+                await handler._init_writer()
+
+        self.assertFalse(handler.initialized)
+        await handler._init_writer()
+        self.assertTrue(handler.initialized)
+
+        await handler.close()
+
+    async def test_init_writer_waiters_retry_if_the_initializer_is_cancelled(
+        self
+    ):
+        handler = AsyncStreamHandler(
+            stream=self.write_pipe, level=10, formatter=Mock()
+        )
+        connect = asyncio.Event()
+        connect_write_pipe = self.loop.connect_write_pipe
+
+        async def wait_and_connect(*args):
+            await connect.wait()
+            return await connect_write_pipe(*args)
+
+        with asynctest.patch.object(
+            self.loop, "connect_write_pipe", side_effect=wait_and_connect
+        ):
+            initializer = asyncio.ensure_future(handler._init_writer())
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(handler._init_writer())
+            await asyncio.sleep(0)
+
+            initializer.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await initializer
+
+            connect.set()
+            self.assertIs(await waiter, handler.writer)
+            self.assertTrue(handler.initialized)
+
+        await handler.close()
+
     async def test_emit_writes_records_into_the_stream(self):
         msg = self.record.msg
-        formatter = Mock(format=Mock(return_value=msg))
-        writer = Mock(write=Mock(), drain=CoroutineMock())
+        formatter = Mock(format_bytes=Mock(return_value=msg.encode()))
+        writer = make_writer()
 
         with patch(
             "aiologger.handlers.streams.StreamWriter", return_value=writer
@@ -106,9 +177,79 @@ class AsyncStreamHandlerTests(asynctest.TestCase):
             writer.write.assert_called_once_with(
                 (msg + handler.terminator).encode()
             )
+            writer.writelines.assert_not_called()
             writer.drain.assert_awaited_once()
             await handler.close()
 
+    async def test_emit_encodes_formatters_without_format_bytes(self):
+        msg = self.record.msg
+        formatter = Mock(spec=["format"], format=Mock(return_value=msg))
+        writer = make_writer()
+
+        with patch(
+            "aiologger.handlers.streams.StreamWriter", return_value=writer
+        ):
+            handler = AsyncStreamHandler(
+                level=10, stream=self.write_pipe, formatter=formatter
+            )
+
+            await handler.emit(self.record)
+
+            writer.write.assert_called_once_with(
+                (msg + handler.terminator).encode()
+            )
+            await handler.close()
+
+    async def test_emit_uses_the_handler_terminator(self):
+        class CRLFStreamHandler(AsyncStreamHandler):
+            terminator = "\r\n"
+
+        msg = self.record.msg
+        formatter = Mock(format_bytes=Mock(return_value=msg.encode()))
+        writer = make_writer()
+
+        with patch(
+            "aiologger.handlers.streams.StreamWriter", return_value=writer
+        ):
+            handler = CRLFStreamHandler(
+                level=10, stream=self.write_pipe, formatter=formatter
+            )
+
+            await handler.emit(self.record)
+
+            writer.write.assert_called_once_with(msg.encode() + b"\r\n")
+            await handler.close()
+
+    async def test_emit_uses_the_terminator_assigned_to_the_handler(self):
+        formatter = Mock(format_bytes=Mock(return_value=b"Xablau!"))
+        writer = make_writer()
+
+        with patch(
+            "aiologger.handlers.streams.StreamWriter", return_value=writer
+        ):
+            handler = AsyncStreamHandler(
+                level=10, stream=self.write_pipe, formatter=formatter
+            )
+            await handler.emit(self.record)
+            handler.terminator = "\r\n"
+            await handler.emit(self.record)
+
+            self.assertEqual(
+                writer.write.call_args_list,
+                [call(b"Xablau!\n"), call(b"Xablau!\r\n")],
+            )
+
+    async def test_emit_skips_records_below_the_handler_level(self):
+        formatter = Mock()
+        handler = AsyncStreamHandler(
+            level=30, stream=self.write_pipe, formatter=formatter
+        )
+
+        await handler.emit(self.record)
+
+        formatter.format_bytes.assert_not_called()
+        self.assertFalse(handler.initialized)
+
     async def test_emit_calls_handle_error_if_an_error_occurs(self):
         writer = Mock(write=CoroutineMock(), drain=CoroutineMock())
         with patch(
@@ -118,7 +259,7 @@ class AsyncStreamHandlerTests(asynctest.TestCase):
             handler = AsyncStreamHandler(
                 level=10,
                 stream=self.write_pipe,
-                formatter=Mock(format=Mock(side_effect=exc)),
+                formatter=Mock(format_bytes=Mock(side_effect=exc)),
             )
             with asynctest.patch.object(
                 handler, "handle_error"
@@ -129,6 +270,27 @@ class AsyncStreamHandlerTests(asynctest.TestCase):
                 writer.write.assert_not_awaited()
                 writer.drain.assert_not_awaited()
 
+    async def test_emit_awaits_handle_error_overrides_calling_super(self):
+        handle_error = CoroutineMock()
+
+        class CustomStreamHandler(AsyncStreamHandler):
+            async def handle_error(self, record, exception):
+                await handle_error(record, exception)
+                await super().handle_error(record, exception)
+
+        exc = Exception("XABLAU")
+        handler = CustomStreamHandler(
+            level=10,
+            stream=self.write_pipe,
+            formatter=Mock(format_bytes=Mock(side_effect=exc)),
+        )
+        with patch("aiologger.handlers.base.sys.stderr") as stderr:
+            await handler.emit(self.record)
+
+            handle_error.assert_awaited_once_with(self.record, exc)
+            stderr.write.assert_called()
+        await handler.close()
+
     async def test_handle_calls_emit_if_a_record_is_loggable(self):
         handler = AsyncStreamHandler(
             level=10, stream=Mock(), formatter=Mock(side_effect=Exception)
@@ -153,6 +315,21 @@ class AsyncStreamHandlerTests(asynctest.TestCase):
             filter.assert_called_once_with(self.record)
             emit.assert_not_awaited()
 
+    async def test_flush_doesnt_drain_if_the_write_buffer_is_empty(self):
+        writer = make_writer(buffer_size=0)
+        with patch(
+            "aiologger.handlers.streams.StreamWriter", return_value=writer
+        ):
+            handler = AsyncStreamHandler(stream=self.write_pipe, level=10)
+            await handler._init_writer()
+
+            await handler.flush()
+            writer.drain.assert_not_awaited()
+
+            writer.transport.get_write_buffer_size.return_value = 42
+            await handler.flush()
+            writer.drain.assert_awaited_once()
+
     async def test_close_closes_the_underlying_transport(self):
         handler = AsyncStreamHandler(stream=self.write_pipe, level=10)
         await handler._init_writer()
@@ -160,6 +337,21 @@ class AsyncStreamHandlerTests(asynctest.TestCase):
         await handler.close()
         self.assertTrue(handler.writer.transport.is_closing())
 
+    async def test_concurrent_closes_close_the_writer_once(self):
+        writer = make_writer(buffer_size=42, close=Mock())
+        with patch(
+            "aiologger.handlers.streams.StreamWriter", return_value=writer
+        ):
+            handler = AsyncStreamHandler(stream=self.write_pipe, level=10)
+            await handler._init_writer()
+
+            await asyncio.gather(
+                handler.close(), handler.close(), handler.close()
+            )
+
+            writer.drain.assert_awaited_once()
+            writer.close.assert_called_once()
+
     async def test_initialized_returns_true_if_writer_is_initialized(self):
         handler = AsyncStreamHandler(stream=self.write_pipe, level=10)
         self.assertFalse(handler.initialized)
@@ -95,6 +95,22 @@ class LoggerTests(asynctest.TestCase):
             logger = Logger.with_default_handlers()
             self.assertCountEqual(logger.handlers, handlers)
 
+    async def test_shutdown_doesnt_close_the_default_handlers_of_other_loggers(
+        self
+    ):
+        logger = Logger.with_default_handlers()
+        other_logger = Logger.with_default_handlers(name="other")
+        for handler in logger.handlers:
+            self.assertNotIn(handler, other_logger.handlers)
+
+        await logger.info("Xablau")
+        await other_logger.info("Xablau")
+        await logger.shutdown()
+
+        for handler in other_logger.handlers:
+            self.assertFalse(handler._closed)
+        await other_logger.shutdown()
+
     async def test_callhandlers_calls_handlers_for_loglevel(self):
         level10_handler = Mock(level=10, handle=CoroutineMock())
         level30_handler = Mock(level=30, handle=CoroutineMock())
@@ -64,3 +64,28 @@ class LogRecordTests(unittest.TestCase):
         self.assertIn(record.levelname, record_str)
         self.assertIn(record.msg, record_str)
         self.assertIn(record.pathname, record_str)
+
+    def test_it_splits_pathname_into_filename_and_module(self):
+        record = LogRecord(
+            name="name",
+            level=LogLevel.INFO,
+            pathname="/aiologger/tests/test_records.py",
+            lineno=666,
+            msg="Hello world!",
+        )
+
+        self.assertEqual(record.filename, "test_records.py")
+        self.assertEqual(record.module, "test_records")
+
+    def test_it_uses_an_unknown_module_if_pathname_isnt_a_path(self):
+        for pathname in (None, ["not", "hashable"]):
+            record = LogRecord(
+                name="name",
+                level=LogLevel.INFO,
+                pathname=pathname,
+                lineno=666,
+                msg="Hello world!",
+            )
+
+            self.assertEqual(record.filename, pathname)
+            self.assertEqual(record.module, "Unknown module")